@@ -1,7 +1,31 @@
 # app_report.py
 import os
-from flask import Flask, render_template, request, jsonify, send_file, abort
+
+# Cooperative I/O for gevent deployments: must patch before anything else
+# imports socket/ssl/threading.
+if os.environ.get("GEVENT") == "1":
+    from gevent import monkey
+    monkey.patch_all()
+
+import hmac
+import queue
+import atexit
+import logging
+import logging.handlers
+import zlib
+import unicodedata
+from urllib.parse import quote
+
+import orjson
+from flask import (
+    Flask, Response, render_template, request, jsonify, abort,
+    stream_with_context,
+)
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
+from jinja2 import TemplateNotFound
+from werkzeug.datastructures import Headers
 from dotenv import load_dotenv
 
 # -------------------------------------------------
@@ -14,6 +38,23 @@ if os.path.exists(ENV_PATH):
 else:
     load_dotenv()  # local development fallback
 
+# -------------------------------------------------
+# Logging (queued: stderr writes happen on a background thread)
+# -------------------------------------------------
+_log_queue = queue.Queue(-1)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+log = logging.getLogger("report")
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+log.setLevel(logging.INFO)
+log.propagate = False
+
 # -------------------------------------------------
 # Report-specific imports
 # -------------------------------------------------
@@ -23,30 +64,118 @@ from auth.auth import verify_user
 # -------------------------------------------------
 # Flask App Setup
 # -------------------------------------------------
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson (C implementation) for jsonify and
+    request.get_json. Unsupported types go through Flask's default hook.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__, static_folder="static", template_folder="templates")
+app.json = ORJSONProvider(app)
 CORS(app)
 
+# gzip JSON (and any buffered CSV) on the wire; XLSX is already a zip.
+# Flask-Compress buffers streamed responses before compressing them, so
+# streams are excluded here and the CSV generator is gzipped chunk by chunk
+# in _report_response instead.
+app.config["COMPRESS_MIMETYPES"] = ["text/csv", "application/json"]
+app.config["COMPRESS_LEVEL"] = 6
+app.config["COMPRESS_STREAMS"] = False
+Compress(app)
+
+# -------------------------------------------------
+# Download Response Helper
+# -------------------------------------------------
+def _attachment_headers(filename):
+    """
+    Content-Disposition for a download, quoted the same way send_file does:
+    non-ASCII names get an ASCII filename plus an RFC 5987 filename*.
+    """
+    try:
+        filename.encode("ascii")
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize("NFKD", filename)
+        simple = simple.encode("ascii", "ignore").decode("ascii")
+        quoted = quote(filename, safe="!#$&+-.^_`|~")
+        names = {"filename": simple, "filename*": f"UTF-8''{quoted}"}
+    else:
+        names = {"filename": filename}
+
+    headers = Headers()
+    headers.set("Content-Disposition", "attachment", **names)
+    return headers
+
+def _gzip_stream(chunks):
+    """
+    gzip a stream of str/bytes chunks incrementally (wbits=31: gzip container).
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def _report_response(body, filename, mimetype):
+    """
+    Build an attachment response; generator bodies (CSV) are streamed chunk
+    by chunk (gzipped on the fly if the client accepts it), bytes bodies
+    (XLSX) are sent as-is.
+    """
+    headers = _attachment_headers(filename)
+
+    if not isinstance(body, (bytes, bytearray)):
+        if request.accept_encodings["gzip"]:
+            body = _gzip_stream(body)
+            headers.set("Content-Encoding", "gzip")
+            headers.add("Vary", "Accept-Encoding")
+        body = stream_with_context(body)
+
+    return Response(
+        body,
+        mimetype=mimetype,
+        headers=headers
+    )
+
 # -------------------------------------------------
 # Home Route
 # -------------------------------------------------
+HOME_TEMPLATE = 'index_emp.html'
+
+_FALLBACK_HOME_HTML = """
+<!doctype html>
+<html>
+<head><meta charset="utf-8"><title>Olyph Report Service</title></head>
+<body>
+    <h3>Olyph Report Backend</h3>
+    <p>This service exposes report generation endpoints.</p>
+</body>
+</html>
+"""
+
+# Probe for the template once at startup instead of on every request
+try:
+    app.jinja_env.get_template(HOME_TEMPLATE)
+    _HAS_HOME_TEMPLATE = True
+except TemplateNotFound:
+    _HAS_HOME_TEMPLATE = False
+
 @app.route('/')
 def home():
     """
     Minimal homepage for the report service.
     """
-    try:
-        return render_template('index_emp.html')
-    except Exception:
-        return """
-        <!doctype html>
-        <html>
-        <head><meta charset="utf-8"><title>Olyph Report Service</title></head>
-        <body>
-            <h3>Olyph Report Backend</h3>
-            <p>This service exposes report generation endpoints.</p>
-        </body>
-        </html>
-        """
+    if _HAS_HOME_TEMPLATE:
+        return render_template(HOME_TEMPLATE)
+    return _FALLBACK_HOME_HTML
 
 # -------------------------------------------------
 # Authenticated Report API
@@ -82,21 +211,16 @@ def api_report():
         fmt = (data.get("format", "csv") or "csv").lower()
 
         # ---------- Generate report ----------
-        bio, filename, mimetype = generate_report_bytes(
+        body, filename, mimetype = generate_report_bytes(
             sheet_id=sheet_id,
             sheet=sheet,
             fmt=fmt
         )
 
-        return send_file(
-            bio,
-            as_attachment=True,
-            download_name=filename,
-            mimetype=mimetype
-        )
+        return _report_response(body, filename, mimetype)
 
-    except FileNotFoundError as e:
-        print("❌ /api/report FileNotFoundError:", e)
+    except FileNotFoundError:
+        log.exception("/api/report FileNotFoundError")
         return jsonify({
             "error": (
                 "Service account JSON not found. "
@@ -104,8 +228,8 @@ def api_report():
             )
         }), 500
 
-    except PermissionError as e:
-        print("❌ /api/report PermissionError:", e)
+    except PermissionError:
+        log.exception("/api/report PermissionError")
         return jsonify({
             "error": (
                 "Permission denied. Ensure the Google Sheet is shared with "
@@ -114,7 +238,7 @@ def api_report():
         }), 500
 
     except Exception as e:
-        print("❌ /api/report error:", type(e).__name__, e)
+        log.exception("/api/report error")
         return jsonify({
             "error": f"Internal error: {type(e).__name__}: {str(e)}"
         }), 500
@@ -133,20 +257,15 @@ def download_report():
     if token_required:
         token = request.args.get("token") or request.headers.get("X-REPORT-TOKEN")
         expected = os.environ.get("REPORT_ACCESS_TOKEN")
-        if not (token and expected and token == expected):
+        if not (token and expected and hmac.compare_digest(token.encode(), expected.encode())):
             return abort(401)
 
     try:
-        bio, filename, mimetype = generate_report_bytes(fmt="csv")
-        return send_file(
-            bio,
-            as_attachment=True,
-            download_name=filename,
-            mimetype=mimetype
-        )
+        body, filename, mimetype = generate_report_bytes(fmt="csv")
+        return _report_response(body, filename, mimetype)
 
     except Exception as e:
-        print("❌ /download-report error:", type(e).__name__, e)
+        log.exception("/download-report error")
         return jsonify({
             "error": f"Internal error: {type(e).__name__}: {str(e)}"
         }), 500
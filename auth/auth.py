@@ -1,5 +1,6 @@
 # auth/auth.py
 import os
+import hmac
 import json
 import bcrypt
 from typing import Dict
@@ -79,6 +80,13 @@ def add_user(username: str, password: str) -> None:
     _save_users(users)
 
 
+# Hash checked against when the username is unknown (or a legacy plaintext
+# password is wrong), so every failure costs the same bcrypt work and response
+# time doesn't reveal which accounts exist. Precomputed (cost 12) so importing
+# this module doesn't run bcrypt.
+_DUMMY_HASH = b"$2b$12$ayh1VHOY7RkOVN/lDw2H2uV70fQvarLnJlbtutmmw3h9ahdMomPV2"
+
+
 def verify_user(username: str, password: str) -> bool:
     if not username or not password:
         return False
@@ -86,18 +94,20 @@ def verify_user(username: str, password: str) -> bool:
     users = _load_users()
     stored = users.get(username)
     if not stored:
+        bcrypt.checkpw(password.encode("utf-8"), _DUMMY_HASH)
         return False
 
     if stored.startswith("$2"):
         return bcrypt.checkpw(password.encode("utf-8"), stored.encode("utf-8"))
 
     # Legacy plaintext support (local only)
-    if password == stored:
+    if hmac.compare_digest(password.encode("utf-8"), stored.encode("utf-8")):
         hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
         users[username] = hashed
         _save_users(users)
         return True
 
+    bcrypt.checkpw(password.encode("utf-8"), _DUMMY_HASH)
     return False
 
 
@@ -3,21 +3,39 @@
 Report agent for Olyph AI.
 
 - Handles Google Service Account auth.
-- Fetches Google Sheet into pandas DataFrame.
-- Exposes helper to return CSV/XLSX as BytesIO for download or further processing.
+- Fetches Google Sheet into pandas DataFrame (several tabs in parallel if needed).
+- Exposes helper to return CSV/XLSX as bytes for download or further processing.
+- Streams CSV row batches so large sheets are never fully buffered.
 """
 
 import os
 import io
-import json
+import re
+import csv
+import math
+import functools
+import numbers
+import zipfile
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import quote
+from xml.sax.saxutils import escape as xml_escape
 
-import pandas as pd
-import gspread
+from typing import TYPE_CHECKING
+
+import orjson
 from dotenv import load_dotenv
 from google.oauth2.service_account import Credentials
 from google.auth.transport.requests import AuthorizedSession
 
+# pandas, gspread and pyarrow are imported inside the functions that use them,
+# so importing this module (and booting the web app) stays fast; the first
+# report request pays the import once.
+if TYPE_CHECKING:
+    import pandas as pd
+
 # -------------------------------------------------
 # Explicit .env loading (Render Secret Files support)
 # -------------------------------------------------
@@ -39,35 +57,45 @@ SCOPES = [
 # -------------------------------------------------
 # Google Service Account Credentials
 # -------------------------------------------------
+# Parsed credentials are cached on (path, mtime) / raw content, so the JSON
+# and RSA key are only re-parsed when the secret actually changes.
+@functools.lru_cache(maxsize=4)
+def _creds_from_info(content):
+    print("🔐 Using GOOGLE_SERVICE_ACCOUNT_JSON_CONTENT")
+    return Credentials.from_service_account_info(orjson.loads(content), scopes=SCOPES)
+
+@functools.lru_cache(maxsize=4)
+def _creds_from_file(path, mtime):
+    print(f"🔐 Using service account file: {path}")
+    return Credentials.from_service_account_file(path, scopes=SCOPES)
+
 def _get_service_account_credentials():
     """
     Priority:
     1) GOOGLE_SERVICE_ACCOUNT_JSON_CONTENT (optional, raw JSON)
     2) Render Secret File: /etc/secrets/service_account.json
     3) Local fallback: ./creds/service_account.json
+
+    Returns the same Credentials object until the source changes.
     """
 
     # 1️⃣ Raw JSON from env (optional)
     content = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON_CONTENT", "").strip()
     if content:
         try:
-            info = json.loads(content)
-            print("🔐 Using GOOGLE_SERVICE_ACCOUNT_JSON_CONTENT")
-            return Credentials.from_service_account_info(info, scopes=SCOPES)
+            return _creds_from_info(content)
         except Exception as e:
             raise RuntimeError(f"Invalid GOOGLE_SERVICE_ACCOUNT_JSON_CONTENT: {e}")
 
     # 2️⃣ Render Secret File (PRIMARY)
     render_path = "/etc/secrets/service_account.json"
     if os.path.exists(render_path):
-        print(f"🔐 Using Render Secret File: {render_path}")
-        return Credentials.from_service_account_file(render_path, scopes=SCOPES)
+        return _creds_from_file(render_path, os.path.getmtime(render_path))
 
     # 3️⃣ Local development fallback
     local_path = os.path.join(os.getcwd(), "creds", "service_account.json")
     if os.path.exists(local_path):
-        print(f"🔐 Using local service account file: {local_path}")
-        return Credentials.from_service_account_file(local_path, scopes=SCOPES)
+        return _creds_from_file(local_path, os.path.getmtime(local_path))
 
     raise FileNotFoundError(
         "Service account credentials not found. "
@@ -78,29 +106,209 @@ def _get_service_account_credentials():
 # -------------------------------------------------
 # GSpread Client Helper
 # -------------------------------------------------
+_CLIENT = None
+_CLIENT_CREDS = None
+_CLIENT_LOCK = threading.Lock()
+
 def get_gspread_client():
     """
-    Create an authenticated gspread client using service account credentials.
+    Return the process-wide authenticated gspread client.
+
+    Built on first use and rebuilt only if the credentials change (e.g. the
+    secret file is rotated); the AuthorizedSession keeps a pooled HTTPS
+    connection to the Google APIs that later requests reuse.
     """
+    global _CLIENT, _CLIENT_CREDS
     creds = _get_service_account_credentials()
-    client = gspread.Client(auth=creds)
-    client.session = AuthorizedSession(creds)
-    return client
+    if _CLIENT is None or _CLIENT_CREDS is not creds:
+        with _CLIENT_LOCK:
+            if _CLIENT is None or _CLIENT_CREDS is not creds:
+                import gspread
+
+                client = gspread.Client(auth=creds)
+                client.session = AuthorizedSession(creds)
+                _CLIENT = client
+                _CLIENT_CREDS = creds
+    return _CLIENT
+
+# -------------------------------------------------
+# Sheet Cache (TTL)
+# -------------------------------------------------
+# Bursts of downloads for the same sheet collapse into one Sheets API fetch:
+# hits are served from the cache, and concurrent misses for one key wait on
+# a single in-flight fetch. Expired entries are pruned on every put and the
+# cache holds at most SHEET_CACHE_MAX_ENTRIES (oldest evicted first).
+# REPORT_CACHE_TTL=0 disables caching.
+SHEET_CACHE_MAX_ENTRIES = 500
+
+_SHEET_CACHE = {}
+_SHEET_IN_FLIGHT = {}
+_SHEET_CACHE_LOCK = threading.Lock()
+
+def _sheet_cache_ttl():
+    try:
+        return float(os.getenv("REPORT_CACHE_TTL", "60"))
+    except ValueError:
+        return 60.0
+
+def _sheet_cache_lookup(key, ttl):
+    # Caller holds _SHEET_CACHE_LOCK
+    entry = _SHEET_CACHE.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if time.monotonic() - stored_at > ttl:
+        # Drop on read too, so stale DataFrames don't linger once traffic stops
+        del _SHEET_CACHE[key]
+        return None
+    return value
+
+def _sheet_cache_put(key, value, ttl):
+    now = time.monotonic()
+    with _SHEET_CACHE_LOCK:
+        for stale in [k for k, (at, _) in _SHEET_CACHE.items() if now - at > ttl]:
+            del _SHEET_CACHE[stale]
+        _SHEET_CACHE.pop(key, None)
+        while len(_SHEET_CACHE) >= SHEET_CACHE_MAX_ENTRIES:
+            del _SHEET_CACHE[next(iter(_SHEET_CACHE))]
+        _SHEET_CACHE[key] = (now, value)
+
+def _sheet_cache_get_or_load(key, load):
+    """
+    Return the cached value for key, or call load() once and cache it.
+    Threads missing on the same key at the same time share one load().
+    """
+    ttl = _sheet_cache_ttl()
+    if ttl <= 0:
+        return load()
+
+    with _SHEET_CACHE_LOCK:
+        cached = _sheet_cache_lookup(key, ttl)
+        if cached is not None:
+            return cached
+        future = _SHEET_IN_FLIGHT.get(key)
+        owner = future is None
+        if owner:
+            future = Future()
+            _SHEET_IN_FLIGHT[key] = future
+
+    if not owner:
+        return future.result()
+
+    try:
+        value = load()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        _sheet_cache_put(key, value, ttl)
+        future.set_result(value)
+        return value
+    finally:
+        with _SHEET_CACHE_LOCK:
+            _SHEET_IN_FLIGHT.pop(key, None)
+
+# -------------------------------------------------
+# Sheets API v4 Helpers
+# -------------------------------------------------
+SHEETS_API_BASE = "https://sheets.googleapis.com/v4/spreadsheets"
+
+def _sheets_get(client, path, params):
+    """
+    GET a Sheets API path and parse the JSON body.
+
+    403/404 are mapped to PermissionError/SpreadsheetNotFound, matching what
+    gspread's open_by_key raised, so callers can report unshared sheets.
+    """
+    from gspread.exceptions import APIError, SpreadsheetNotFound
+
+    try:
+        resp = client.request("get", f"{SHEETS_API_BASE}/{path}", params=params)
+    except APIError as e:
+        status = getattr(e.response, "status_code", None)
+        if status == 403:
+            raise PermissionError(str(e)) from e
+        if status == 404:
+            raise SpreadsheetNotFound(str(e)) from e
+        raise
+    return orjson.loads(resp.content)
+
+def _resolve_sheet_title(client, sheet_id, sheet_name_or_index):
+    """
+    Map a worksheet index to its title via one metadata call (cached);
+    names are returned unchanged.
+    """
+    if not isinstance(sheet_name_or_index, int):
+        return sheet_name_or_index
+
+    def _load():
+        resp = _sheets_get(
+            client,
+            quote(sheet_id, safe=""),
+            {"fields": "sheets.properties.title"},
+        )
+        sheets = resp.get("sheets", [])
+        if not 0 <= sheet_name_or_index < len(sheets):
+            raise ValueError(f"Worksheet index {sheet_name_or_index} out of range.")
+        return sheets[sheet_name_or_index]["properties"]["title"]
+
+    return _sheet_cache_get_or_load(("title", sheet_id, sheet_name_or_index), _load)
+
+def _fetch_sheet_values(client, sheet_id, title, value_render_option):
+    """
+    Fetch a whole worksheet with spreadsheets.values.get, rows padded to a
+    common width (the API omits trailing empty cells).
+    """
+    range_a1 = "'{}'".format(title.replace("'", "''"))
+    resp = _sheets_get(
+        client,
+        f"{quote(sheet_id, safe='')}/values/{quote(range_a1, safe='')}",
+        {
+            "majorDimension": "ROWS",
+            "valueRenderOption": value_render_option,
+        },
+    )
+
+    values = resp.get("values", [])
+    width = max((len(row) for row in values), default=0)
+    for row in values:
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+    return values
 
 # -------------------------------------------------
 # Fetch Google Sheet → DataFrame
 # -------------------------------------------------
+# Columns with fewer unique values than this fraction of rows become
+# category dtype (status, region, ...): one copy of each distinct string.
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+def _categorize_low_cardinality(df: "pd.DataFrame"):
+    """
+    Convert low-cardinality columns to category dtype in place.
+    """
+    n_rows = len(df)
+    if not n_rows:
+        return
+    for i in range(df.shape[1]):
+        col = df.iloc[:, i]
+        if col.nunique(dropna=False) < n_rows * CATEGORY_MAX_UNIQUE_RATIO:
+            df.isetitem(i, col.astype("category"))
+
 def fetch_sheet_as_dataframe(
     sheet_id=None,
     sheet_name_or_index=None,
     value_render_option="FORMATTED_VALUE",
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     """
     Fetch a Google Sheet and return it as a pandas DataFrame.
 
     Fallbacks:
     - REPORT_SHEET_ID
     - REPORT_SHEET_NAME_OR_INDEX
+
+    Results are cached for REPORT_CACHE_TTL seconds (default 60); callers
+    must treat the returned DataFrame as read-only.
     """
 
     if not sheet_id:
@@ -119,59 +327,384 @@ def fetch_sheet_as_dataframe(
         else:
             sheet_name_or_index = 0
 
-    client = get_gspread_client()
-    spreadsheet = client.open_by_key(sheet_id)
+    return _sheet_cache_get_or_load(
+        ("df", sheet_id, sheet_name_or_index, value_render_option),
+        lambda: _load_sheet_dataframe(sheet_id, sheet_name_or_index, value_render_option),
+    )
 
-    if isinstance(sheet_name_or_index, int):
-        worksheet = spreadsheet.get_worksheet(sheet_name_or_index)
-    else:
-        worksheet = spreadsheet.worksheet(sheet_name_or_index)
+def _load_sheet_dataframe(sheet_id, sheet_name_or_index, value_render_option):
+    import pandas as pd
 
-    values = worksheet.get_all_values()
+    client = get_gspread_client()
+    title = _resolve_sheet_title(client, sheet_id, sheet_name_or_index)
+    values = _fetch_sheet_values(client, sheet_id, title, value_render_option)
     if not values:
-        return pd.DataFrame()
+        df = pd.DataFrame()
+    else:
+        header = values[0]
+        rows = values[1:]
+        # Build column-wise (zip transposes in C) so pandas doesn't copy the
+        # row lists; positional keys keep duplicate/blank headers intact.
+        cols = list(zip(*rows)) if rows else [()] * len(header)
+        df = pd.DataFrame({
+            i: pd.array(col, dtype="string") for i, col in enumerate(cols)
+        })
+        df.columns = header
+        _categorize_low_cardinality(df)
+
+    return df
+
+def fetch_sheets_as_dataframes(sheet_id=None, sheet_list=(), value_render_option="FORMATTED_VALUE"):
+    """
+    Fetch several worksheets of one spreadsheet concurrently.
+
+    Returns DataFrames in the same order as sheet_list. The requests are
+    I/O-bound, so threads overlap the HTTP waits and share the client's
+    pooled session.
+    """
+    sheet_list = list(sheet_list)
+    if not sheet_list:
+        return []
+
+    def _fetch(sheet):
+        return fetch_sheet_as_dataframe(
+            sheet_id=sheet_id,
+            sheet_name_or_index=sheet,
+            value_render_option=value_render_option,
+        )
 
-    header = values[0]
-    rows = values[1:]
-    return pd.DataFrame(rows, columns=header)
+    with ThreadPoolExecutor(max_workers=min(8, len(sheet_list))) as ex:
+        return list(ex.map(_fetch, sheet_list))
 
 # -------------------------------------------------
 # DataFrame → Bytes Helpers
 # -------------------------------------------------
-def dataframe_to_csv_bytes(df: pd.DataFrame):
+CSV_BATCH_ROWS = 1000
+
+# CSV format (both writers): header and string values are always quoted,
+# numbers are not. This is what Arrow's "needed" quoting style produces, and
+# csv.QUOTE_NONNUMERIC gives the same for the fallback path.
+
+# (pyarrow, pyarrow.csv) after the first probe, (None, None) if not installed
+_ARROW = None
+
+def _arrow_modules():
+    global _ARROW
+    if _ARROW is None:
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pacsv
+            _ARROW = (pa, pacsv)
+        except ImportError:
+            _ARROW = (None, None)
+    return _ARROW
+
+def _use_arrow_csv():
+    """
+    Arrow CSV writer is used when pyarrow is installed, unless
+    REPORT_CSV_ENGINE=pandas forces the pure-Python path.
+    """
+    if os.getenv("REPORT_CSV_ENGINE", "arrow").lower() == "pandas":
+        return False
+    return _arrow_modules()[0] is not None
+
+def _to_arrow_table(df: "pd.DataFrame"):
+    """
+    Convert to an Arrow table, or None if a dtype isn't supported.
+    """
+    pa, _ = _arrow_modules()
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        # Category columns arrive as dictionary arrays; write plain values
+        for i, field in enumerate(table.schema):
+            if pa.types.is_dictionary(field.type):
+                table = table.set_column(
+                    i, field.name, table.column(i).cast(field.type.value_type)
+                )
+        return table
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+def _arrow_write_options(include_header):
+    _, pacsv = _arrow_modules()
+    # "needed" quotes every string value and the header, not only values
+    # containing separators or quotes
+    return pacsv.WriteOptions(include_header=include_header, quoting_style="needed")
+
+def dataframe_to_csv_bytes(df: "pd.DataFrame") -> bytes:
     buf = io.BytesIO()
-    df.to_csv(buf, index=False)
-    buf.seek(0)
-    return buf
+    table = _to_arrow_table(df) if _use_arrow_csv() else None
+    if table is not None:
+        _, pacsv = _arrow_modules()
+        pacsv.write_csv(table, buf, write_options=_arrow_write_options(True))
+    else:
+        for chunk in _iter_csv_python(df, CSV_BATCH_ROWS):
+            buf.write(chunk.encode("utf-8"))
+    return buf.getvalue()
 
-def dataframe_to_excel_bytes(df: pd.DataFrame):
+def _iter_csv_arrow(table, batch_size):
+    pa, pacsv = _arrow_modules()
     buf = io.BytesIO()
-    with pd.ExcelWriter(buf, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False, sheet_name="Sheet1")
+    include_header = True
+    for batch in table.to_batches(max_chunksize=batch_size):
+        pacsv.write_csv(
+            pa.Table.from_batches([batch], schema=table.schema),
+            buf,
+            write_options=_arrow_write_options(include_header),
+        )
+        include_header = False
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+
+    if include_header:
+        # No rows: still emit the header line
+        pacsv.write_csv(table, buf, write_options=_arrow_write_options(True))
+        yield buf.getvalue()
+
+def _iter_csv_python(df: "pd.DataFrame", batch_size):
+    buf = io.StringIO()
+    writer = csv.writer(buf, quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n")
+
+    writer.writerow(df.columns)
+    yield buf.getvalue()
     buf.seek(0)
-    return buf
+    buf.truncate()
+
+    for start in range(0, len(df), batch_size):
+        batch = df.iloc[start:start + batch_size]
+        writer.writerows(batch.itertuples(index=False, name=None))
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+
+def iter_csv(df: "pd.DataFrame", batch_size=CSV_BATCH_ROWS):
+    """
+    Yield the DataFrame as CSV, one batch of rows at a time.
+
+    Uses pyarrow's C++ CSV writer when available; the csv module path is
+    the fallback for missing pyarrow or unsupported dtypes. Both produce the
+    same quoting (strings and header quoted, numbers bare).
+    """
+    table = _to_arrow_table(df) if _use_arrow_csv() else None
+    if table is not None:
+        return _iter_csv_arrow(table, batch_size)
+    return _iter_csv_python(df, batch_size)
+
+# Minimal single-sheet XLSX parts. Writing these directly (instead of via
+# openpyxl) lets rows stream into the zip with no per-cell objects.
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+    '</Types>'
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/>'
+    '</Relationships>'
+)
+_XLSX_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+_XLSX_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_XLSX_SHEET_TAIL = '</sheetData></worksheet>'
+
+# Control characters that are not allowed anywhere in XML 1.0
+_XML_ILLEGAL_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+def _xlsx_column_letter(idx):
+    """
+    0 -> "A", 25 -> "Z", 26 -> "AA".
+    """
+    letters = ""
+    idx += 1
+    while idx:
+        idx, rem = divmod(idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+def _xlsx_text(text):
+    return xml_escape(_XML_ILLEGAL_CHARS.sub("", text))
+
+def _xlsx_inline(ref, text):
+    if not text:
+        return ""
+    return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{_xlsx_text(text)}</t></is></c>'
+
+def _xlsx_cell(ref, value, shared=None):
+    if shared is not None:
+        idx = shared.get(value)
+        if idx is not None:
+            return f'<c r="{ref}" t="s"><v>{idx}</v></c>'
+    # Sheet values are strings, so check that first
+    if isinstance(value, str):
+        return _xlsx_inline(ref, value)
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, numbers.Number):
+        if not math.isfinite(value):
+            return ""
+        return f'<c r="{ref}"><v>{value!r}</v></c>'
+    if value is None:
+        return ""
+
+    import pandas as pd
+
+    if pd.isna(value):
+        return ""
+    return _xlsx_inline(ref, str(value))
+
+def _xlsx_row(row_num, letters, values, shared_cols):
+    cells = "".join(
+        _xlsx_cell(f"{letter}{row_num}", value, shared)
+        for letter, value, shared in zip(letters, values, shared_cols)
+    )
+    return f'<row r="{row_num}">{cells}</row>'
+
+def _xlsx_shared_strings(df: "pd.DataFrame"):
+    """
+    Build the shared-strings table from category columns.
+
+    Returns (strings, shared_cols): shared_cols[i] maps a column's category
+    values to their index in strings, or is None for non-category columns.
+    """
+    import pandas as pd
+
+    index = {}
+    shared_cols = []
+    for dtype in df.dtypes:
+        if not isinstance(dtype, pd.CategoricalDtype):
+            shared_cols.append(None)
+            continue
+        lookup = {}
+        for cat in dtype.categories:
+            text = str(cat)
+            if text:
+                lookup[cat] = index.setdefault(text, len(index))
+        shared_cols.append(lookup)
+    return list(index), shared_cols
+
+def _xlsx_sst_xml(strings):
+    items = "".join(
+        f'<si><t xml:space="preserve">{_xlsx_text(text)}</t></si>' for text in strings
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        f'uniqueCount="{len(strings)}">{items}</sst>'
+    )
+
+def dataframe_to_excel_bytes(df: "pd.DataFrame", batch_size=CSV_BATCH_ROWS) -> bytes:
+    """
+    Write the DataFrame as a single-sheet XLSX, streaming row XML straight
+    into the zip archive in batches. Category columns are written as
+    shared strings; everything else as inline strings.
+    """
+    buf = io.BytesIO()
+    letters = [_xlsx_column_letter(i) for i in range(len(df.columns))]
+    strings, shared_cols = _xlsx_shared_strings(df)
+    no_shared = [None] * len(letters)
+
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _XLSX_CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _XLSX_ROOT_RELS)
+        zf.writestr("xl/workbook.xml", _XLSX_WORKBOOK)
+        zf.writestr("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS)
+        zf.writestr("xl/styles.xml", _XLSX_STYLES)
+        zf.writestr("xl/sharedStrings.xml", _xlsx_sst_xml(strings))
+
+        with zf.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            sheet.write(_XLSX_SHEET_HEAD.encode("utf-8"))
+            sheet.write(_xlsx_row(1, letters, df.columns, no_shared).encode("utf-8"))
+
+            pending = []
+            rows = df.itertuples(index=False, name=None)
+            for row_num, row in enumerate(rows, start=2):
+                pending.append(_xlsx_row(row_num, letters, row, shared_cols))
+                if len(pending) >= batch_size:
+                    sheet.write("".join(pending).encode("utf-8"))
+                    pending = []
+            if pending:
+                sheet.write("".join(pending).encode("utf-8"))
+
+            sheet.write(_XLSX_SHEET_TAIL.encode("utf-8"))
+
+    return buf.getvalue()
 
 # -------------------------------------------------
 # Main Report Generator
 # -------------------------------------------------
+# [formatted_at, "%Y%m%dT%H%M%SZ"]; requests within the same wall-clock second
+# share one strftime. Slice assignment swaps both fields at once under the GIL.
+_TS_CACHE = [0.0, ""]
+
+def _report_timestamp():
+    now = time.time()
+    if int(now) != int(_TS_CACHE[0]):
+        _TS_CACHE[:] = [now, datetime.utcfromtimestamp(now).strftime("%Y%m%dT%H%M%SZ")]
+    return _TS_CACHE[1]
+
 def generate_report_bytes(sheet_id=None, sheet=None, fmt="csv"):
     """
     Returns:
-        (BytesIO, filename, mimetype)
+        (body, filename, mimetype)
+
+    body is a generator of CSV chunks for "csv" and bytes for "xlsx".
+    Rendered XLSX bytes are cached like the sheet itself (REPORT_CACHE_TTL);
+    CSV is streamed, so only its DataFrame is cached.
     """
 
-    df = fetch_sheet_as_dataframe(sheet_id=sheet_id, sheet_name_or_index=sheet)
-    timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    def _fetch():
+        return fetch_sheet_as_dataframe(sheet_id=sheet_id, sheet_name_or_index=sheet)
+
+    timestamp = _report_timestamp()
     chosen_id = sheet_id or os.getenv("REPORT_SHEET_ID", "unknown")
 
     fmt_lower = fmt.lower()
     if fmt_lower in ("csv", "text/csv"):
-        bio = dataframe_to_csv_bytes(df)
+        body = iter_csv(_fetch())
         filename = f"sheet_{chosen_id}_{timestamp}.csv"
         mimetype = "text/csv"
 
     elif fmt_lower in ("xlsx", "excel"):
-        bio = dataframe_to_excel_bytes(df)
+        body = _sheet_cache_get_or_load(
+            ("xlsx", chosen_id, sheet),
+            lambda: dataframe_to_excel_bytes(_fetch()),
+        )
         filename = f"sheet_{chosen_id}_{timestamp}.xlsx"
         mimetype = (
             "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
@@ -180,4 +713,4 @@ def generate_report_bytes(sheet_id=None, sheet=None, fmt="csv"):
     else:
         raise ValueError("Unsupported format. Use 'csv' or 'xlsx'.")
 
-    return bio, filename, mimetype
+    return body, filename, mimetype
@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+import sys
+
+# Modules live at the repo root (no package), so make them importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -0,0 +1,81 @@
+# tests/test_report_agent.py
+"""
+Read back XLSX files from report_agent's hand-built writer.
+"""
+
+import io
+import warnings
+import zipfile
+import xml.etree.ElementTree as ET
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+import report_agent
+
+NS = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+def _sample_df():
+    return pd.DataFrame({
+        "Name": ['a<b&"c', "", "plain"],
+        "Status": pd.Categorical(["open", "open", "closed"]),
+        "Note": ["x", "y", ""],
+    })
+
+
+def _read_cells(data):
+    """
+    Return {cell_ref: text} for sheet1, resolving shared strings.
+    """
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        sst = ET.fromstring(zf.read("xl/sharedStrings.xml"))
+        sheet = ET.fromstring(zf.read("xl/worksheets/sheet1.xml"))
+
+    shared = [si.findtext("m:t", namespaces=NS) for si in sst.findall("m:si", NS)]
+    cells = {}
+    for c in sheet.iter(f"{{{NS['m']}}}c"):
+        if c.get("t") == "s":
+            cells[c.get("r")] = shared[int(c.findtext("m:v", namespaces=NS))]
+        else:
+            cells[c.get("r")] = c.findtext("m:is/m:t", namespaces=NS)
+    return cells, sheet
+
+
+def test_excel_bytes_round_trip():
+    cells, sheet = _read_cells(report_agent.dataframe_to_excel_bytes(_sample_df()))
+
+    # header
+    assert [cells["A1"], cells["B1"], cells["C1"]] == ["Name", "Status", "Note"]
+    # escaped text survives
+    assert cells["A2"] == 'a<b&"c'
+    # empty strings produce no cell at all
+    assert "A3" not in cells
+    assert "C4" not in cells
+    assert cells["A4"] == "plain"
+    # category column goes through the shared-strings table
+    assert [cells["B2"], cells["B3"], cells["B4"]] == ["open", "open", "closed"]
+    status_types = {
+        c.get("t")
+        for c in sheet.iter(f"{{{NS['m']}}}c")
+        if c.get("r") in ("B2", "B3", "B4")
+    }
+    assert status_types == {"s"}
+
+
+def test_excel_bytes_open_cleanly_in_openpyxl():
+    openpyxl = pytest.importorskip("openpyxl")
+    data = report_agent.dataframe_to_excel_bytes(_sample_df())
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        wb = openpyxl.load_workbook(io.BytesIO(data))
+
+    rows = list(wb["Sheet1"].iter_rows(values_only=True))
+    assert rows == [
+        ("Name", "Status", "Note"),
+        ('a<b&"c', "open", "x"),
+        (None, "open", "y"),
+        ("plain", "closed", None),
+    ]